@@ -1,20 +1,141 @@
 """File operations for AutoGPT"""
+import asyncio
+import atexit
+import mmap
 import os
 import os.path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, List
+from typing import Dict, Generator, List, Optional, Set, Tuple, Union
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# Files smaller than this are read normally; below it the cost of setting up
+# a memory mapping outweighs the copy it avoids
+MMAP_MIN_FILE_SIZE = 64 * 1024
 
 # Set a dedicated folder for file I/O
 WORKING_DIRECTORY = Path(os.getcwd()) / "auto_gpt_workspace"
 
 # Create the directory if it doesn't exist
-if not os.path.exists(WORKING_DIRECTORY):
-    os.makedirs(WORKING_DIRECTORY)
+os.makedirs(WORKING_DIRECTORY, exist_ok=True)
 
 LOG_FILE = "file_logger.txt"
 LOG_FILE_PATH = WORKING_DIRECTORY / LOG_FILE
 WORKING_DIRECTORY = str(WORKING_DIRECTORY)
 
+# The joined log path is constant, so operations on the log itself can skip
+# the safe_join machinery entirely
+_LOG_FILE_FULL_PATH = str(LOG_FILE_PATH)
+
+# Precomputed prefix for containment checks against the working directory
+_WD_PREFIX = WORKING_DIRECTORY + os.sep
+
+# Header written when the operations log is first created
+LOG_HEADER = "File Operation Logger "
+
+# In-memory index of the operations log, keyed by operation, so duplicate
+# checks don't have to re-read the whole log file on every call
+_operations_index: Optional[Dict[str, Set[str]]] = None
+
+# Persistent append descriptor for the operations log, so each entry costs a
+# single write syscall instead of an open/write/close round-trip
+_log_fd: Optional[int] = None
+
+
+def _get_log_fd() -> int:
+    """Return a persistent append-mode descriptor for the operations log"""
+    global _log_fd
+    if _log_fd is None:
+        _log_fd = os.open(LOG_FILE_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if os.fstat(_log_fd).st_size == 0:
+            os.write(_log_fd, LOG_HEADER.encode("utf-8"))
+        atexit.register(_close_log_fd)
+    return _log_fd
+
+
+def _close_log_fd() -> None:
+    """Close the operations log descriptor if it is open"""
+    global _log_fd
+    if _log_fd is not None:
+        os.close(_log_fd)
+        _log_fd = None
+
+
+# Cached append-mode descriptors keyed by path, so back-to-back appends to the
+# same file skip the open/close round-trip; bounded by LRU eviction
+_append_fds: "OrderedDict[str, int]" = OrderedDict()
+MAX_APPEND_FDS = 64
+
+
+def _get_append_fd(filepath: str) -> int:
+    """Return a cached append-mode descriptor for the given path"""
+    fd = _append_fds.get(filepath)
+    if fd is not None:
+        _append_fds.move_to_end(filepath)
+        return fd
+    fd = os.open(filepath, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    _append_fds[filepath] = fd
+    if len(_append_fds) > MAX_APPEND_FDS:
+        _, oldest = _append_fds.popitem(last=False)
+        os.close(oldest)
+    return fd
+
+
+def _evict_append_fd(filepath: str) -> None:
+    """Close and drop the cached append descriptor for a path, if any
+
+    Must be called before a file is deleted or truncated, so a stale
+    descriptor never keeps writing to the old inode.
+    """
+    fd = _append_fds.pop(filepath, None)
+    if fd is not None:
+        os.close(fd)
+
+
+def _close_append_fds() -> None:
+    """Close every cached append descriptor"""
+    while _append_fds:
+        _, fd = _append_fds.popitem()
+        os.close(fd)
+
+
+atexit.register(_close_append_fds)
+
+
+def _load_operations_index() -> Dict[str, Set[str]]:
+    """Load the operations recorded in the operations log
+
+    Returns:
+        Dict[str, Set[str]]: The filenames already touched, per operation
+    """
+    global _operations_index
+    if _operations_index is None:
+        _operations_index = {}
+        try:
+            with open(LOG_FILE_PATH, "rb") as f:
+                log = f.read()
+        except FileNotFoundError:
+            return _operations_index
+        # Parse the raw bytes in one pass and decode only the short operation
+        # and filename fields, not the whole log
+        header = LOG_HEADER.encode("utf-8")
+        if log.startswith(header):
+            # The header shares its line with the first entry
+            log = log[len(header) :]
+        for line in log.split(b"\n"):
+            operation, separator, filename = line.partition(b": ")
+            if separator:
+                _operations_index.setdefault(operation.decode("utf-8"), set()).add(
+                    filename.decode("utf-8")
+                )
+    return _operations_index
+
 
 def check_duplicate_operation(operation: str, filename: str) -> bool:
     """Check if the operation has already been performed on the given file
@@ -26,9 +147,7 @@ def check_duplicate_operation(operation: str, filename: str) -> bool:
     Returns:
         bool: True if the operation has already been performed on the file
     """
-    log_content = read_file(LOG_FILE)
-    log_entry = f"{operation}: {filename}\n"
-    return log_entry in log_content
+    return filename in _load_operations_index().get(operation, ())
 
 
 def log_operation(operation: str, filename: str) -> None:
@@ -40,12 +159,8 @@ def log_operation(operation: str, filename: str) -> None:
     """
     log_entry = f"{operation}: {filename}\n"
 
-    # Create the log file if it doesn't exist
-    if not os.path.exists(LOG_FILE_PATH):
-        with open(LOG_FILE_PATH, "w", encoding="utf-8") as f:
-            f.write("File Operation Logger ")
-
-    append_to_file(LOG_FILE, log_entry)
+    _load_operations_index().setdefault(operation, set()).add(filename)
+    os.write(_get_log_fd(), log_entry.encode("utf-8"))
 
 
 def safe_join(base: str, *paths) -> str:
@@ -58,29 +173,55 @@ def safe_join(base: str, *paths) -> str:
     Returns:
         str: The joined path
     """
+    return _safe_join_cached(base, paths)
+
+
+@lru_cache(maxsize=1024)
+def _safe_join_cached(base: str, paths: Tuple[str, ...]) -> str:
+    """Join and validate a path, memoizing the result
+
+    The same filenames are joined repeatedly within a single operation
+    (duplicate check, the operation itself, then logging), so cache the
+    joined path keyed on the arguments.
+    """
     new_path = os.path.join(base, *paths)
     norm_new_path = os.path.normpath(new_path)
 
-    if os.path.commonprefix([base, norm_new_path]) != base:
+    if base == WORKING_DIRECTORY:
+        # Single C-level prefix comparison against the precomputed working
+        # directory prefix, rather than commonprefix's character-wise scan
+        if norm_new_path != base and not norm_new_path.startswith(_WD_PREFIX):
+            raise ValueError("Attempted to access outside of working directory.")
+    elif os.path.commonprefix([base, norm_new_path]) != base:
         raise ValueError("Attempted to access outside of working directory.")
 
     return norm_new_path
 
 
 def split_file(
-    content: str, max_length: int = 4000, overlap: int = 0
+    content: Union[str, bytes, mmap.mmap],
+    max_length: int = 4000,
+    overlap: int = 0,
 ) -> Generator[str, None, None]:
     """
     Split text into chunks of a specified maximum length with a specified overlap
     between chunks.
 
-    :param content: The input text to be split into chunks
+    :param content: The input text to be split into chunks, either a str or a
+        bytes-like object (e.g. a memory-mapped file) holding UTF-8 text
     :param max_length: The maximum length of each chunk,
         default is 4000 (about 1k token)
     :param overlap: The number of overlapping characters between chunks,
         default is no overlap
     :return: A generator yielding chunks of text
     """
+    if not isinstance(content, str):
+        # Decode chunk by chunk so the whole file is never materialized as
+        # a str; a chunk boundary may split a multi-byte character
+        for chunk in split_file_bytes(content, max_length=max_length, overlap=overlap):
+            yield bytes(chunk).decode("utf-8", errors="replace")
+        return
+
     start = 0
     content_length = len(content)
 
@@ -94,6 +235,38 @@ def split_file(
         start += max_length - overlap
 
 
+def split_file_bytes(
+    content: Union[bytes, bytearray, memoryview, mmap.mmap],
+    max_length: int = 4000,
+    overlap: int = 0,
+) -> Generator[memoryview, None, None]:
+    """
+    Split a bytes-like buffer into chunks without copying.
+
+    Follows the same chunking scheme as split_file, but yields memoryview
+    slices over the underlying buffer, so nothing is copied until a caller
+    decodes or serializes a chunk.
+
+    :param content: The bytes-like buffer to be split into chunks
+    :param max_length: The maximum length of each chunk,
+        default is 4000 (about 1k token)
+    :param overlap: The number of overlapping bytes between chunks,
+        default is no overlap
+    :return: A generator yielding memoryview chunks
+    """
+    view = memoryview(content)
+    start = 0
+    content_length = len(view)
+
+    while start < content_length:
+        end = start + max_length
+        if end + overlap < content_length:
+            yield view[start : end + overlap]
+        else:
+            yield view[start:content_length]
+        start += max_length - overlap
+
+
 def read_file(filename: str) -> str:
     """Read a file and return the contents
 
@@ -104,7 +277,10 @@ def read_file(filename: str) -> str:
         str: The contents of the file
     """
     try:
-        filepath = safe_join(WORKING_DIRECTORY, filename)
+        if filename == LOG_FILE:
+            filepath = _LOG_FILE_FULL_PATH
+        else:
+            filepath = safe_join(WORKING_DIRECTORY, filename)
         with open(filepath, "r", encoding="utf-8") as f:
             content = f.read()
         return content
@@ -112,8 +288,75 @@ def read_file(filename: str) -> str:
         return f"Error: {str(e)}"
 
 
+async def aread_file(filename: str) -> str:
+    """Read a file without blocking the event loop
+
+    Uses aiofiles when it is installed, otherwise runs the synchronous read
+    in a worker thread, so concurrent tool calls overlap their I/O waits
+    either way.
+
+    Args:
+        filename (str): The name of the file to read
+
+    Returns:
+        str: The contents of the file
+    """
+    if aiofiles is None:
+        return await asyncio.get_event_loop().run_in_executor(
+            None, read_file, filename
+        )
+    try:
+        filepath = safe_join(WORKING_DIRECTORY, filename)
+        async with aiofiles.open(filepath, "r", encoding="utf-8") as f:
+            return await f.read()
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
+async def awrite_to_file(filename: str, text: str) -> str:
+    """Write text to a file without blocking the event loop
+
+    Runs write_to_file in a worker thread so the duplicate check and
+    operation logging stay on the single synchronous code path.
+
+    Args:
+        filename (str): The name of the file to write to
+        text (str): The text to write to the file
+
+    Returns:
+        str: A message indicating success or failure
+    """
+    return await asyncio.get_event_loop().run_in_executor(
+        None, write_to_file, filename, text
+    )
+
+
+def read_file_mmap(filename: str) -> Union[str, mmap.mmap]:
+    """Read a file, memory-mapping it if it is large enough to benefit
+
+    The mapping shares pages with the OS page cache, so large files are not
+    copied into the heap before being split into chunks.
+
+    Args:
+        filename (str): The name of the file to read
+
+    Returns:
+        Union[str, mmap.mmap]: The contents of the file
+    """
+    filepath = safe_join(WORKING_DIRECTORY, filename)
+    if os.path.getsize(filepath) < MMAP_MIN_FILE_SIZE:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return f.read()
+    with open(filepath, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def ingest_file(
-    filename: str, memory, max_length: int = 4000, overlap: int = 200
+    filename: str,
+    memory,
+    max_length: int = 4000,
+    overlap: int = 200,
+    max_workers: int = 1,
 ) -> None:
     """
     Ingest a file by reading its content, splitting it into chunks with a specified
@@ -123,29 +366,66 @@ def ingest_file(
     :param memory: An object with an add() method to store the chunks in memory
     :param max_length: The maximum length of each chunk, default is 4000
     :param overlap: The number of overlapping characters between chunks, default is 200
+    :param max_workers: The number of threads adding chunks to memory concurrently;
+        defaults to 1 (serial), only raise it if memory.add is thread-safe
     """
     try:
         print(f"Working with file {filename}")
-        content = read_file(filename)
+        content = read_file_mmap(filename)
         content_length = len(content)
         print(f"File length: {content_length} characters")
 
-        chunks = list(split_file(content, max_length=max_length, overlap=overlap))
-
-        num_chunks = len(chunks)
-        for i, chunk in enumerate(chunks):
-            print(f"Ingesting chunk {i + 1} / {num_chunks} into memory")
-            memory_to_add = (
-                f"Filename: {filename}\n" f"Content part#{i + 1}/{num_chunks}: {chunk}"
-            )
-
-            memory.add(memory_to_add)
+        # Iterate the generator directly instead of materializing every chunk;
+        # the chunk count can be derived from the content length and step size
+        step = max_length - overlap
+        num_chunks = (content_length + step - 1) // step
+
+        def payloads() -> Generator[str, None, None]:
+            for i, chunk in enumerate(
+                split_file(content, max_length=max_length, overlap=overlap), start=1
+            ):
+                print(f"Ingesting chunk {i} / {num_chunks} into memory")
+                yield (
+                    f"Filename: {filename}\n" f"Content part#{i}/{num_chunks}: {chunk}"
+                )
+
+        if max_workers > 1 and num_chunks > 1:
+            # memory.add is typically a network round-trip to an embedding
+            # service, so independent chunks can overlap their waits
+            with ThreadPoolExecutor(max_workers=min(max_workers, num_chunks)) as pool:
+                list(pool.map(memory.add, payloads()))
+        else:
+            for memory_to_add in payloads():
+                memory.add(memory_to_add)
 
         print(f"Done ingesting {num_chunks} chunks from {filename}.")
     except Exception as e:
         print(f"Error while ingesting file '{filename}': {str(e)}")
 
 
+def ingest_files(
+    filenames: List[str],
+    memory,
+    max_length: int = 4000,
+    overlap: int = 200,
+    max_workers: int = 1,
+) -> None:
+    """
+    Ingest a batch of files into the memory storage.
+
+    Each file goes through the memory-mapped read path of ingest_file, so a
+    large corpus is never held in the heap all at once.
+
+    :param filenames: The names of the files to ingest
+    :param memory: An object with an add() method to store the chunks in memory
+    :param max_length: The maximum length of each chunk, default is 4000
+    :param overlap: The number of overlapping characters between chunks, default is 200
+    :param max_workers: Passed through to ingest_file; see its documentation
+    """
+    for filename in filenames:
+        ingest_file(filename, memory, max_length, overlap, max_workers)
+
+
 def write_to_file(filename: str, text: str) -> str:
     """Write text to a file
 
@@ -160,17 +440,46 @@ def write_to_file(filename: str, text: str) -> str:
         return "Error: File has already been updated."
     try:
         filepath = safe_join(WORKING_DIRECTORY, filename)
-        directory = os.path.dirname(filepath)
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(text)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        _evict_append_fd(filepath)
+        _write_bytes(filepath, text.encode("utf-8"), os.O_TRUNC)
         log_operation("write", filename)
         return "File written to successfully."
     except Exception as e:
         return f"Error: {str(e)}"
 
 
+def _write_bytes(filepath: str, data: bytes, flags: int) -> None:
+    """Write bytes to a file through a raw descriptor
+
+    Skips the TextIOWrapper/BufferedWriter layers that a single full-buffer
+    write doesn't need.
+
+    Args:
+        filepath (str): The path of the file to write to
+        data (bytes): The bytes to write
+        flags (int): Extra open(2) flags, e.g. os.O_TRUNC or os.O_APPEND
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | flags, 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a descriptor, retrying partial writes
+
+    Args:
+        fd (int): The descriptor to write to
+        data (bytes): The bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
 def append_to_file(filename: str, text: str) -> str:
     """Append text to a file
 
@@ -182,9 +491,11 @@ def append_to_file(filename: str, text: str) -> str:
         str: A message indicating success or failure
     """
     try:
-        filepath = safe_join(WORKING_DIRECTORY, filename)
-        with open(filepath, "a") as f:
-            f.write(text)
+        if filename == LOG_FILE:
+            filepath = _LOG_FILE_FULL_PATH
+        else:
+            filepath = safe_join(WORKING_DIRECTORY, filename)
+        _write_all(_get_append_fd(filepath), text.encode("utf-8"))
         log_operation("append", filename)
         return "Text appended successfully."
     except Exception as e:
@@ -204,6 +515,7 @@ def delete_file(filename: str) -> str:
         return "Error: File has already been deleted."
     try:
         filepath = safe_join(WORKING_DIRECTORY, filename)
+        _evict_append_fd(filepath)
         os.remove(filepath)
         log_operation("delete", filename)
         return "File deleted successfully."
@@ -227,11 +539,28 @@ def search_files(directory: str) -> List[str]:
     else:
         search_directory = safe_join(WORKING_DIRECTORY, directory)
 
-    for root, _, files in os.walk(search_directory):
-        for file in files:
-            if file.startswith("."):
-                continue
-            relative_path = os.path.relpath(os.path.join(root, file), WORKING_DIRECTORY)
-            found_files.append(relative_path)
+    # Walk with scandir directly instead of os.walk: hidden entries are
+    # skipped before any path work, and relative paths are sliced off a
+    # known prefix instead of recomputed with os.path.relpath per file
+    prefix_len = len(WORKING_DIRECTORY) + 1
+    stack = [search_directory]
+
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Match os.walk's default resilience: a missing or unreadable
+            # directory is skipped rather than aborting the whole walk
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    # Don't descend into symlinked directories, like os.walk
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    found_files.append(entry.path[prefix_len:])
 
     return found_files
@@ -2,7 +2,7 @@ import argparse
 import logging
 
 from autogpt.config import Config
-from autogpt.commands.file_operations import ingest_file, search_files
+from autogpt.commands.file_operations import ingest_file, ingest_files, search_files
 from autogpt.memory import get_memory
 
 cfg = Config()
@@ -28,8 +28,7 @@ def ingest_directory(directory, memory, args):
     """
     try:
         files = search_files(directory)
-        for file in files:
-            ingest_file(file, memory, args.max_length, args.overlap)
+        ingest_files(files, memory, args.max_length, args.overlap)
     except Exception as e:
         print(f"Error while ingesting directory '{directory}': {str(e)}")
 
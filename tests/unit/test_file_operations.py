@@ -0,0 +1,146 @@
+import os
+import unittest
+
+from autogpt.commands import file_operations
+
+
+class TestOperationsIndex(unittest.TestCase):
+    """Tests for the in-memory duplicate-operation index built from the log"""
+
+    def setUp(self):
+        # Preserve any real log and start each test from a clean slate
+        self.log_path = str(file_operations.LOG_FILE_PATH)
+        self.log_backup = None
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "rb") as f:
+                self.log_backup = f.read()
+            os.remove(self.log_path)
+        file_operations._close_log_fd()
+        file_operations._operations_index = None
+
+    def tearDown(self):
+        file_operations._close_log_fd()
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        if self.log_backup is not None:
+            with open(self.log_path, "wb") as f:
+                f.write(self.log_backup)
+        file_operations._operations_index = None
+
+    def write_log(self, content: str) -> None:
+        with open(self.log_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def test_loads_old_format_log(self):
+        # Logs written by older versions share the header line with the
+        # first entry; the first entry must still be indexed
+        self.write_log(
+            "File Operation Logger write: first.txt\n"
+            "append: second.txt\n"
+            "delete: first.txt\n"
+        )
+        self.assertTrue(
+            file_operations.check_duplicate_operation("write", "first.txt")
+        )
+        self.assertTrue(
+            file_operations.check_duplicate_operation("append", "second.txt")
+        )
+        self.assertTrue(
+            file_operations.check_duplicate_operation("delete", "first.txt")
+        )
+        self.assertFalse(
+            file_operations.check_duplicate_operation("write", "second.txt")
+        )
+        self.assertFalse(
+            file_operations.check_duplicate_operation("delete", "second.txt")
+        )
+
+    def test_separator_inside_filename(self):
+        # Only the first ": " separates the operation from the filename
+        self.write_log("File Operation Logger write: odd: name.txt\n")
+        self.assertTrue(
+            file_operations.check_duplicate_operation("write", "odd: name.txt")
+        )
+        self.assertFalse(
+            file_operations.check_duplicate_operation("write", "name.txt")
+        )
+
+    def test_missing_log_file(self):
+        # No log on disk means nothing is a duplicate
+        self.assertFalse(
+            file_operations.check_duplicate_operation("write", "anything.txt")
+        )
+
+    def test_log_operation_survives_index_reload(self):
+        # Entries written through log_operation must parse back identically
+        # when the index is rebuilt from disk, header included
+        file_operations.log_operation("write", "indexed.txt")
+        file_operations.log_operation("append", "indexed.txt")
+        self.assertTrue(
+            file_operations.check_duplicate_operation("write", "indexed.txt")
+        )
+
+        file_operations._close_log_fd()
+        file_operations._operations_index = None
+
+        self.assertTrue(
+            file_operations.check_duplicate_operation("write", "indexed.txt")
+        )
+        self.assertTrue(
+            file_operations.check_duplicate_operation("append", "indexed.txt")
+        )
+        self.assertFalse(
+            file_operations.check_duplicate_operation("delete", "indexed.txt")
+        )
+
+
+class TestSafeJoin(unittest.TestCase):
+    """Tests for the working-directory containment check in safe_join"""
+
+    def setUp(self):
+        self.wd = file_operations.WORKING_DIRECTORY
+
+    def test_joins_paths_inside_working_directory(self):
+        self.assertEqual(
+            file_operations.safe_join(self.wd, "a", "b.txt"),
+            os.path.join(self.wd, "a", "b.txt"),
+        )
+
+    def test_allows_base_itself(self):
+        self.assertEqual(file_operations.safe_join(self.wd, ""), self.wd)
+
+    def test_allows_parent_references_that_stay_inside(self):
+        self.assertEqual(
+            file_operations.safe_join(self.wd, "a/../b.txt"),
+            os.path.join(self.wd, "b.txt"),
+        )
+
+    def test_rejects_parent_escape(self):
+        with self.assertRaises(ValueError):
+            file_operations.safe_join(self.wd, "../evil")
+        with self.assertRaises(ValueError):
+            file_operations.safe_join(self.wd, "a/../../evil")
+
+    def test_rejects_absolute_path(self):
+        with self.assertRaises(ValueError):
+            file_operations.safe_join(self.wd, "/etc/passwd")
+
+    def test_rejects_sibling_directory_with_prefix_name(self):
+        # A sibling whose name merely extends the working directory's name
+        # slipped past the old commonprefix check; it must be rejected
+        sibling = f"../{os.path.basename(self.wd)}_evil/x.txt"
+        with self.assertRaises(ValueError):
+            file_operations.safe_join(self.wd, sibling)
+
+    def test_memoized_calls_stay_consistent(self):
+        # The cached join must return the same result and keep raising for
+        # rejected paths on repeated calls
+        first = file_operations.safe_join(self.wd, "repeat.txt")
+        self.assertEqual(file_operations.safe_join(self.wd, "repeat.txt"), first)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                file_operations.safe_join(self.wd, "../repeat.txt")
+
+
+if __name__ == "__main__":
+    unittest.main()